@@ -5,16 +5,17 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 import io
 
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import streamlit as st
-import yfinance as yf
 
-from utils import load_data  # shared, cached downloader
+from utils import load_data, downsample, get_earnings_dates, get_dividends  # shared, cached helpers
 
 # ─── Page‑level settings ──────────────────────────────────────
 st.set_page_config(page_title="Stock Timeline", page_icon="📈")
@@ -60,7 +61,7 @@ if df is None or df.empty:
     st.warning("No data returned for the selected ticker / date range.")
     st.stop()
 
-price_col = "Adj Close" if "Adj Close" in df.columns else "Close"
+price_col = df.attrs.get("price_col", "Close")
 prices = df[price_col].dropna()
 if prices.empty:
     st.warning("No price data available.")
@@ -73,12 +74,17 @@ if normalise:
 else:
     y_label = "Price (USD)"
 
-chart_df = prices.reset_index().rename(columns={"index": "Date", price_col: "Price"})
+# Full-resolution frame for the CSV export; the M4 reduction below is
+# strictly a plotting optimisation and must not thin the download.
+export_df = prices.reset_index().rename(columns={"index": "Date", price_col: "Price"})
+
+# Cap the number of plotted points for long ranges (M4 downsampling)
+chart_df = downsample(prices).reset_index().rename(columns={"index": "Date", price_col: "Price"})
 
 # ─── Build figure: price line + volume bars ──────────────────
 fig = make_subplots(specs=[[{"secondary_y": True}]])
 fig.add_trace(
-    go.Scatter(x=chart_df["Date"], y=chart_df["Price"], mode="lines", name="Price"),
+    go.Scattergl(x=chart_df["Date"], y=chart_df["Price"], mode="lines", name="Price"),
     secondary_y=False,
 )
 
@@ -98,38 +104,86 @@ if scale == "Log":
     fig.update_yaxes(type="log", secondary_y=False)
 
 # ─── Event markers: earnings & dividends ─────────────────────
+
+def _clip_to_range(obj):
+    """Keep rows inside the selected window via datetime64 comparison
+    (``.index.date`` would box every timestamp into a Python object)."""
+    lo, hi = pd.Timestamp(start_date), pd.Timestamp(end_date)
+    if obj.index.tz is not None:
+        lo, hi = lo.tz_localize(obj.index.tz), hi.tz_localize(obj.index.tz)
+    return obj[(obj.index >= lo) & (obj.index <= hi)]
+
 with st.spinner("Fetching corporate actions …"):
+    # Collect every marker first and attach them in one update_layout
+    # call – repeated add_vline re-copies the layout per event, which
+    # turns O(N) events into O(N²) work for dense windows.
+    shapes: list[dict] = []
+    annotations: list[dict] = []
     try:
-        info = yf.Ticker(ticker)
-        # Earnings calendar
-        cal = info.earnings_dates
+        # Earnings calendar (cached – no network hit on rerun)
+        cal = get_earnings_dates(ticker)
         if cal is not None and not cal.empty:
-            cal = cal[(cal.index.date >= start_date) & (cal.index.date <= end_date)]
+            cal = _clip_to_range(cal)
             for d in cal.index:
-                fig.add_vline(x=d, line_dash="dot", line_color="gray", annotation_text="Earnings")
-        # Dividend events
-        divs = info.dividends
+                shapes.append(dict(type="line", x0=d, x1=d, yref="paper", y0=0, y1=1,
+                                   line=dict(dash="dot", color="gray")))
+                annotations.append(dict(x=d, y=1, yref="paper", text="Earnings", showarrow=False))
+        # Dividend events (cached)
+        divs = get_dividends(ticker)
         if divs is not None and not divs.empty:
-            divs = divs[(divs.index.date >= start_date) & (divs.index.date <= end_date)]
+            divs = _clip_to_range(divs)
             for d, v in divs.items():
-                fig.add_vline(x=d, line_dash="dot", line_color="green", annotation_text=f"Div {v:.2f}")
+                shapes.append(dict(type="line", x0=d, x1=d, yref="paper", y0=0, y1=1,
+                                   line=dict(dash="dot", color="green")))
+                annotations.append(dict(x=d, y=1, yref="paper", text=f"Div {v:.2f}", showarrow=False))
     except Exception:
         # Fail silently – corporate events are optional
         pass
 
+    if shapes:
+        fig.update_layout(shapes=shapes, annotations=annotations)
+
 # ─── Render chart ────────────────────────────────────────────
 st.plotly_chart(fig, use_container_width=True)
 
 # ─── Downloads ───────────────────────────────────────────────
-# Raw CSV
-tmp_csv = chart_df.to_csv(index=False).encode()
-st.download_button("Download CSV", tmp_csv, file_name=f"{ticker}_prices.csv", mime="text/csv")
-
-# PNG snapshot (optional – requires kaleido)
-try:
-    img_bytes = fig.to_image(format="png", width=1200, height=600, engine="kaleido")
-    st.download_button("Download PNG", img_bytes, file_name=f"{ticker}_timeline.png", mime="image/png")
-except Exception:
-    st.caption("Install **kaleido** for static image export: `pip install -U kaleido`. ")
+# Raw CSV – serialised once per distinct frame, not on every rerun
+
+@st.cache_data(ttl=60 * 60)
+def _csv_bytes(df: pd.DataFrame) -> bytes:
+    return df.to_csv(index=False).encode()
+
+st.download_button("Download CSV", _csv_bytes(export_df), file_name=f"{ticker}_prices.csv", mime="text/csv")
+
+# PNG snapshot (optional – requires kaleido). The Kaleido render is a
+# slow out-of-process call, so it runs on demand in a background worker
+# and the download button appears once the bytes are ready, keeping the
+# chart interactive in the meantime.
+
+def _fig_png(fig_json: str) -> bytes:
+    return pio.from_json(fig_json).to_image(format="png", width=1200, height=600, engine="kaleido")
+
+if st.button("Prepare PNG"):
+    executor = st.session_state.setdefault("_png_executor", ThreadPoolExecutor(max_workers=2))
+    fig_json = fig.to_json()
+    st.session_state["_png_future"] = executor.submit(_fig_png, fig_json)
+    st.session_state["_png_fig_json"] = fig_json
+
+png_future = st.session_state.get("_png_future")
+if png_future is not None and st.session_state.get("_png_fig_json") != fig.to_json():
+    # The chart changed (ticker/date range/scale) since the render was
+    # queued – drop the stale result so the old bytes are never offered
+    # under the new filename.
+    png_future = None
+    st.session_state.pop("_png_future", None)
+    st.session_state.pop("_png_fig_json", None)
+if png_future is not None:
+    if not png_future.done():
+        st.caption("Rendering PNG in the background – it will be ready on the next interaction.")
+    else:
+        try:
+            st.download_button("Download PNG", png_future.result(), file_name=f"{ticker}_timeline.png", mime="image/png")
+        except Exception:
+            st.caption("Install **kaleido** for static image export: `pip install -U kaleido`. ")
 
 st.caption(f"Prices from {start_date} to {end_date} · data via Yahoo Finance")
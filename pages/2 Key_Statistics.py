@@ -5,6 +5,7 @@
 
 from datetime import date, timedelta
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 import plotly.express as px
@@ -43,18 +44,22 @@ if df.empty:
     st.warning("No data returned – check ticker or date range.")
     st.stop()
 
-price_col = "Adj Close" if "Adj Close" in df.columns else "Close"
+price_col = df.attrs.get("price_col", "Close")
 prices    = df[price_col].dropna()
 if prices.empty:
     st.warning("No price data available.")
     st.stop()
 
-# ── compute metrics ───────────────────────────────────────────
-total_return = (prices.iloc[-1] / prices.iloc[0] - 1) * 100
-daily_ret    = prices.pct_change().dropna()
-annual_vol   = daily_ret.std() * (252 ** 0.5) * 100
-drawdown     = (prices / prices.cummax() - 1) * 100
-max_dd       = abs(drawdown.min())
+# ── compute metrics (one NumPy traversal of the price vector) ─
+p            = prices.to_numpy(dtype=np.float64)
+ret          = np.diff(p) / p[:-1]
+logret       = np.diff(np.log(p))  # standard vol input; one pass, no dropna
+total_return = (p[-1] / p[0] - 1) * 100
+annual_vol   = logret.std(ddof=1) * np.sqrt(252) * 100
+peak         = np.maximum.accumulate(p)
+max_dd       = abs((p / peak - 1).min()) * 100
+
+daily_ret = pd.Series(ret, index=prices.index[1:])  # reused by the histogram
 
 # ── display ──────────────────────────────────────────────────
 c1, c2, c3 = st.columns(3)
@@ -10,16 +10,16 @@ Only uses libraries listed in *requirements.txt* (streamlit, yfinance,
 plotly, pandas, numpy).
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
-import math
 
 import numpy as np
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
-import yfinance as yf
 
-from utils import load_data  # shared, cached data fetcher
+from utils import load_data, get_info  # shared, cached data fetchers
 
 # ─── Page config & header ─────────────────────────────────────
 st.set_page_config(page_title="Comparison Dashboard", page_icon="🔎")
@@ -76,13 +76,19 @@ frames: list[pd.DataFrame] = []
 market_caps: dict[str, float | None] = {}
 
 with st.spinner("Fetching data …"):
+    # Fan the I/O-bound downloads out over threads: wall time becomes
+    # max() of the requests instead of their sum.
+    with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as ex:
+        results = dict(zip(tickers, ex.map(lambda t: load_data(t, start_date, end_date), tickers)))
+        cap_futures = {t: ex.submit(get_info, t) for t in tickers}
+
     for t in tickers:
-        df = load_data(t, start_date, end_date)
+        df = results[t]
         if df is None or df.empty:
             st.warning(f"No data for {t} – skipping.")
             continue
 
-        price_col = "Adj Close" if "Adj Close" in df.columns else "Close"
+        price_col = df.attrs.get("price_col", "Close")
         tmp = (
             df[[price_col]]
             .rename(columns={price_col: "Price"})
@@ -93,10 +99,9 @@ with st.spinner("Fetching data …"):
         )
         frames.append(tmp)
 
-        # Market‑cap info (optional)
+        # Market‑cap info (optional, cached)
         try:
-            info = yf.Ticker(t).info
-            market_caps[t] = info.get("marketCap")
+            market_caps[t] = cap_futures[t].result().get("marketCap")
         except Exception:
             market_caps[t] = None
 
@@ -105,53 +110,70 @@ if not frames:
     st.stop()
 
 combined_df = pd.concat(frames, ignore_index=True)
-combined_df["Date"] = pd.to_datetime(combined_df["Date"])  # ensure datetime
+# ensure datetime without re-parsing a column that already is one
+if not pd.api.types.is_datetime64_any_dtype(combined_df["Date"]):
+    combined_df["Date"] = pd.to_datetime(combined_df["Date"])
 
-# ─── Normalise so all series start at 100 ─────────────────────
-start_prices = (
-    combined_df.sort_values("Date").groupby("Ticker")["Price"].first().to_dict()
-)
+# Categorical ticker codes: ~5 symbols repeated over every row, so this
+# shrinks the column to int8 codes and makes the groupbys hash-free.
+combined_df["Ticker"] = combined_df["Ticker"].astype("category")
 
-combined_df["Indexed"] = combined_df.apply(
-    lambda r: r["Price"] / start_prices[r["Ticker"]] * 100, axis=1
-)
+# Sort once by (Ticker, Date); downstream groupbys pass sort=False and
+# per-ticker slices come out date-ordered without re-sorting.
+combined_df = combined_df.sort_values(["Ticker", "Date"]).reset_index(drop=True)
+
+# ─── Normalise so all series start at 100 ─────────────────────
+# Vectorised: divide each price by its ticker's first price in one
+# C-level pass instead of a Python-level row loop.
+first_price = combined_df.groupby("Ticker", sort=False)["Price"].transform("first")
+combined_df["Indexed"] = combined_df["Price"].to_numpy() / first_price.to_numpy() * 100.0
 
 # ─── Chart: Normalised performance ───────────────────────────
-line_fig = px.line(
-    combined_df,
-    x="Date",
-    y="Indexed",
-    color="Ticker",
+# Pivot once and add one WebGL trace per ticker, skipping the
+# melt/groupby machinery plotly express runs on long-form input.
+indexed_wide = combined_df.pivot(index="Date", columns="Ticker", values="Indexed").sort_index()
+
+line_fig = go.Figure()
+for col in indexed_wide.columns:
+    line_fig.add_trace(
+        go.Scattergl(
+            x=indexed_wide.index,
+            y=indexed_wide[col],
+            mode="lines",
+            name=str(col),
+            line=dict(color=colour_map[str(col)]),
+        )
+    )
+line_fig.update_layout(
     title="Normalised Performance (Start = 100)",
-    labels={"Indexed": "Indexed Price", "Date": "Date"},
-    color_discrete_map=colour_map,
+    xaxis_title="Date",
+    yaxis_title="Indexed Price",
+    legend_title_text="Ticker",
 )
-line_fig.update_layout(legend_title_text="Ticker")
 if log_scale:
     line_fig.update_yaxes(type="log")
 
 st.plotly_chart(line_fig, use_container_width=True)
 
 # ─── Summary metrics table ───────────────────────────────────
-summary: list[dict[str, float]] = []
-for t in tickers:
-    subset = combined_df[combined_df["Ticker"] == t].sort_values("Date")
-    if subset.empty:
-        continue
-    price_series = subset["Price"]
-    total_ret = (price_series.iloc[-1] / price_series.iloc[0] - 1) * 100
-    daily_ret = price_series.pct_change().dropna()
-    vol = daily_ret.std() * math.sqrt(252) * 100  # annualised %
-    summary.append(
-        {
-            "Ticker": t,
-            "Total Return (%)": round(total_ret, 2),
-            "Annual Volatility (%)": round(vol, 2),
-            "MarketCap": market_caps.get(t),
-        }
-    )
-
-summary_df = pd.DataFrame(summary).set_index("Ticker")
+# One vectorised pass per statistic instead of a mask + pct_change loop
+# over each ticker.
+grp = combined_df.groupby("Ticker", sort=False, observed=True)["Price"]
+total_ret = (grp.last() / grp.first() - 1) * 100
+
+# log-returns: standard vol input, one vectorised diff over the pivot
+logret_wide = np.log(combined_df.pivot(index="Date", columns="Ticker", values="Price")).diff()
+vol = logret_wide.std() * np.sqrt(252) * 100  # annualised %
+
+summary_df = pd.DataFrame(
+    {
+        "Total Return (%)": total_ret.round(2),
+        "Annual Volatility (%)": vol.round(2),
+    }
+)
+# .astype(object) first: mapping the CategoricalIndex directly would
+# yield a categorical column, which px.scatter(size=...) can't max().
+summary_df["MarketCap"] = summary_df.index.astype(object).map(market_caps)
 
 st.write("### Comparison Metrics")
 st.dataframe(summary_df)
@@ -173,13 +195,10 @@ if not summary_df.empty:
 
 # ─── Correlation heat‑map of returns ─────────────────────────
 with st.expander("Correlation Matrix", expanded=False):
-    # Build return matrix
-    ret_frames: list[pd.Series] = []
-    for t in tickers:
-        px_sub = combined_df[combined_df["Ticker"] == t].set_index("Date")["Price"]
-        ret_frames.append(px_sub.pct_change().rename(t))
-
-    ret_df = pd.concat(ret_frames, axis=1).dropna(how="all")
+    # Build return matrix: one pivot + vectorised pct_change instead of
+    # a boolean mask and Series copy per ticker
+    wide = combined_df.pivot(index="Date", columns="Ticker", values="Price").sort_index()
+    ret_df = wide.pct_change().dropna(how="all")
     if ret_df.shape[1] >= 2:
         corr = ret_df.corr()
         heat = px.imshow(
@@ -11,7 +11,24 @@ import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
-from utils import load_data  # cached data fetcher
+from utils import load_data, compute_indicators  # cached fetcher, fused indicators
+
+# Rolling kernels – use bottleneck's SIMD-friendly C loops when the
+# optional package is installed, otherwise fall back to pandas rolling.
+try:
+    import bottleneck as bn
+
+    def _move_mean(a: np.ndarray, w: int) -> np.ndarray:
+        return bn.move_mean(a, w)
+
+    def _move_std(a: np.ndarray, w: int) -> np.ndarray:
+        return bn.move_std(a, w, ddof=1)
+except ImportError:
+    def _move_mean(a: np.ndarray, w: int) -> np.ndarray:
+        return pd.Series(a).rolling(w).mean().to_numpy()
+
+    def _move_std(a: np.ndarray, w: int) -> np.ndarray:
+        return pd.Series(a).rolling(w).std().to_numpy()
 
 # ─── Page config & header ─────────────────────────────────────
 st.set_page_config(page_title="Technical Analysis", page_icon="💹")
@@ -65,72 +82,71 @@ if df is None or df.empty:
     st.error(f"No data available for {ticker}.")
     st.stop()
 
-price_col = "Adj Close" if "Adj Close" in df.columns else "Close"
-prices = df[price_col].dropna().copy()
-prices.index = pd.to_datetime(prices.index)  # ensure datetime index
+price_col = df.attrs.get("price_col", "Close")
+prices = df[price_col].dropna().copy()  # load_data guarantees a DatetimeIndex
 
 # ─── Compute indicators ──────────────────────────────────────
 df = pd.DataFrame({"Price": prices})
 
-df[f"SMA_{short_ma}"] = prices.rolling(window=short_ma).mean()
-df[f"SMA_{long_ma}"] = prices.rolling(window=long_ma).mean()
+# SMAs, RSI and MACD (12-26-9) come out of one fused pass
+indicators = compute_indicators(prices, short_ma, long_ma, rsi_n=rsi_win)
+df[f"SMA_{short_ma}"] = indicators["sma_short"]
+df[f"SMA_{long_ma}"] = indicators["sma_long"]
+df["RSI"] = indicators["rsi"]
+df["MACD"] = indicators["macd"]
+df["Signal"] = indicators["signal"]
+df["Hist"] = indicators["hist"]
 
 # Bollinger Bands (20, 2σ)
 if bollinger:
-    sma20 = prices.rolling(20).mean()
-    std20 = prices.rolling(20).std()
+    p = prices.to_numpy(dtype=np.float64)
+    sma20 = _move_mean(p, 20)
+    std20 = _move_std(p, 20)
     df["BB_upper"] = sma20 + 2 * std20
     df["BB_lower"] = sma20 - 2 * std20
 
-# RSI
-delta = prices.diff()
-gain = delta.clip(lower=0).rolling(rsi_win).mean()
-loss = (-delta.clip(upper=0)).rolling(rsi_win).mean()
-rs = gain / loss
-rsi_series = 100 - 100 / (1 + rs)
-
-df["RSI"] = rsi_series
-
-# MACD (12-26-9)
-ema12 = prices.ewm(span=12, adjust=False).mean()
-ema26 = prices.ewm(span=26, adjust=False).mean()
-df["MACD"] = ema12 - ema26
-df["Signal"] = df["MACD"].ewm(span=9, adjust=False).mean()
-df["Hist"] = df["MACD"] - df["Signal"]
-
-# ─── Price chart with moving averages & Bollinger Bands ──────
-price_fig = go.Figure()
-price_fig.add_trace(go.Scatter(x=df.index, y=df["Price"], name="Price", mode="lines"))
-price_fig.add_trace(go.Scatter(x=df.index, y=df[f"SMA_{short_ma}"], name=f"{short_ma}-SMA"))
-price_fig.add_trace(go.Scatter(x=df.index, y=df[f"SMA_{long_ma}"], name=f"{long_ma}-SMA"))
-
-if bollinger:
-    price_fig.add_trace(go.Scatter(x=df.index, y=df["BB_upper"], name="BB upper", line=dict(width=0.5, dash="dot")))
-    price_fig.add_trace(go.Scatter(x=df.index, y=df["BB_lower"], name="BB lower", line=dict(width=0.5, dash="dot")))
-
-price_fig.update_layout(
-    title=f"{ticker} Price + MAs", yaxis_title="Price (USD)", legend_title_text="Series"
-)
-st.plotly_chart(price_fig, use_container_width=True)
-
-# ─── RSI chart ────────────────────────────────────────────────
-rsi_fig = go.Figure()
-rsi_fig.add_trace(go.Scatter(x=df.index, y=df["RSI"], name=f"RSI ({rsi_win})", mode="lines"))
-rsi_fig.add_hline(y=30, line_dash="dot", line_color="green", annotation_text="30")
-rsi_fig.add_hline(y=70, line_dash="dot", line_color="red", annotation_text="70")
-rsi_fig.update_layout(title=f"{ticker} RSI ({rsi_win}-day)", yaxis_title="RSI")
-st.plotly_chart(rsi_fig, use_container_width=True)
-
-# ─── MACD chart ───────────────────────────────────────────────
-# Colour histogram bars by sign for quicker polarity reading
-bar_colors = np.where(df["Hist"] > 0, "green", "red")
-
-macd_fig = go.Figure()
-macd_fig.add_trace(go.Scatter(x=df.index, y=df["MACD"], name="MACD", mode="lines"))
-macd_fig.add_trace(go.Scatter(x=df.index, y=df["Signal"], name="Signal", mode="lines"))
-macd_fig.add_trace(go.Bar(x=df.index, y=df["Hist"], name="Hist", marker_color=bar_colors, opacity=0.4))
-macd_fig.update_layout(title=f"{ticker} MACD", yaxis_title="MACD")
-
-st.plotly_chart(macd_fig, use_container_width=True)
+# ─── Chart builders (cached – reruns that keep the same data skip the
+# figure build and Plotly JSON serialisation entirely) ───────
+
+@st.cache_data(ttl=60 * 60)
+def build_price_fig(data: pd.DataFrame, sym: str, short_w: int, long_w: int, show_bb: bool) -> go.Figure:
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(x=data.index, y=data["Price"], name="Price", mode="lines"))
+    fig.add_trace(go.Scattergl(x=data.index, y=data[f"SMA_{short_w}"], name=f"{short_w}-SMA"))
+    fig.add_trace(go.Scattergl(x=data.index, y=data[f"SMA_{long_w}"], name=f"{long_w}-SMA"))
+    if show_bb:
+        fig.add_trace(go.Scattergl(x=data.index, y=data["BB_upper"], name="BB upper", line=dict(width=0.5, dash="dot")))
+        fig.add_trace(go.Scattergl(x=data.index, y=data["BB_lower"], name="BB lower", line=dict(width=0.5, dash="dot")))
+    fig.update_layout(
+        title=f"{sym} Price + MAs", yaxis_title="Price (USD)", legend_title_text="Series"
+    )
+    return fig
+
+
+@st.cache_data(ttl=60 * 60)
+def build_rsi_fig(rsi: pd.Series, sym: str, win: int) -> go.Figure:
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(x=rsi.index, y=rsi, name=f"RSI ({win})", mode="lines"))
+    fig.add_hline(y=30, line_dash="dot", line_color="green", annotation_text="30")
+    fig.add_hline(y=70, line_dash="dot", line_color="red", annotation_text="70")
+    fig.update_layout(title=f"{sym} RSI ({win}-day)", yaxis_title="RSI")
+    return fig
+
+
+@st.cache_data(ttl=60 * 60)
+def build_macd_fig(data: pd.DataFrame, sym: str) -> go.Figure:
+    # Colour histogram bars by sign for quicker polarity reading
+    bar_colors = np.where(data["Hist"] > 0, "green", "red")
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(x=data.index, y=data["MACD"], name="MACD", mode="lines"))
+    fig.add_trace(go.Scattergl(x=data.index, y=data["Signal"], name="Signal", mode="lines"))
+    fig.add_trace(go.Bar(x=data.index, y=data["Hist"], name="Hist", marker_color=bar_colors, opacity=0.4))
+    fig.update_layout(title=f"{sym} MACD", yaxis_title="MACD")
+    return fig
+
+
+st.plotly_chart(build_price_fig(df, ticker, short_ma, long_ma, bollinger), use_container_width=True)
+st.plotly_chart(build_rsi_fig(df["RSI"], ticker, rsi_win), use_container_width=True)
+st.plotly_chart(build_macd_fig(df[["MACD", "Signal", "Hist"]], ticker), use_container_width=True)
 
 st.caption(f"Technical indicators for **{ticker}** from {start_date} to {end_date}.")
@@ -6,14 +6,26 @@ optional SPY overlay, rolling volatility, and a monthly‑return heatmap.
 Only core libraries (streamlit · yfinance · plotly · pandas · numpy).
 """
 
-from datetime import date, timedelta, datetime as dt
+from datetime import date, timedelta
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
 import streamlit as st
 
-from utils import load_data
+# plotly.express is imported lazily where figures are built – the module
+# is heavy and reruns that st.stop() before charting never need it.
+
+from utils import load_data, load_many, downsample, rolling_vol
+
+# Month labels for the heatmap – built once at import, indexed by month
+# number rather than formatting strings per row.
+_MONTH_ABBR = np.array(["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                        "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"])
+
+# Secondary charts are read-only: disabling interactivity skips the
+# hover/zoom event machinery in the browser. The price chart stays
+# fully interactive.
+STATIC = {"staticPlot": True, "displayModeBar": False}
 
 # ─── Page config & header ─────────────────────────────────────
 st.set_page_config(page_title="ETF & Index Explorer", page_icon="🌐")
@@ -60,35 +72,44 @@ if start_date > end_date:
 
 # ─── Fetch price data ────────────────────────────────────────
 with st.spinner("Fetching data …"):
-    df = load_data(ticker, start_date, end_date)
+    if compare_spy and ticker != "SPY":
+        # One batched request covers both symbols in a single round-trip
+        frames = load_many([ticker, "SPY"], start_date, end_date)
+        df, spy_df = frames[ticker], frames["SPY"]
+    else:
+        df = load_data(ticker, start_date, end_date)
+        spy_df = None
 
 if df is None or df.empty:
     st.error("No data available for the selected symbol / date range.")
     st.stop()
 
-price_col = "Adj Close" if "Adj Close" in df.columns else "Close"
+price_col = df.attrs.get("price_col", "Close")
 prices = df[price_col].dropna()
 if prices.empty:
     st.error("Price column is empty.")
     st.stop()
 
-df.index = pd.to_datetime(df.index)
-
 # ─── Price chart (+ optional SPY overlay) ────────────────────
+import plotly.express as px  # first chart built below; cached on reruns
+
 if compare_spy and ticker != "SPY":
-    spy_df = load_data("SPY", start_date, end_date)
     if spy_df is not None and not spy_df.empty:
-        spy_prices = spy_df[price_col].dropna()
-        prices_norm = prices / prices.iloc[0] * 100
-        spy_norm = spy_prices / spy_prices.iloc[0] * 100
+        spy_prices = spy_df[spy_df.attrs.get("price_col", "Close")].dropna()
+        # Single multiply by a precomputed scale factor – one vectorised
+        # pass instead of a divide pass followed by a multiply pass.
+        prices_norm = downsample(prices * (100.0 / prices.iat[0]))
+        spy_norm = downsample(spy_prices * (100.0 / spy_prices.iat[0]))
         price_fig = px.line(title=f"{choice} vs SPY (Normalised)")
         price_fig.add_scatter(x=prices_norm.index, y=prices_norm, name=ticker)
         price_fig.add_scatter(x=spy_norm.index, y=spy_norm, name="SPY", line=dict(dash="dot"))
     else:
         st.warning("Could not fetch SPY benchmark data.")
-        price_fig = px.line(x=df.index, y=prices, title=f"{choice} Price History")
+        plot_prices = downsample(prices)
+        price_fig = px.line(x=plot_prices.index, y=plot_prices, title=f"{choice} Price History")
 else:
-    price_fig = px.line(x=df.index, y=prices, title=f"{choice} Price History")
+    plot_prices = downsample(prices)
+    price_fig = px.line(x=plot_prices.index, y=plot_prices, title=f"{choice} Price History")
 
 price_fig.update_layout(xaxis_title="Date", yaxis_title="Price (USD)")
 st.plotly_chart(price_fig, use_container_width=True)
@@ -96,13 +117,17 @@ st.plotly_chart(price_fig, use_container_width=True)
 # ─── Key metrics ─────────────────────────────────────────────
 latest_price = prices.iloc[-1]
 rolling_year = 252
-rolling_high = prices.rolling(window=rolling_year).max().iloc[-1]
-rolling_low = prices.rolling(window=rolling_year).min().iloc[-1]
-
-ytd_start = dt(today.year, 1, 1)
-ytd_prices = prices[prices.index >= ytd_start]
-ytd_return = (latest_price / ytd_prices.iloc[0] - 1) * 100 if not ytd_prices.empty else np.nan
-period_return = (latest_price / prices.iloc[0] - 1) * 100
+# Only the trailing window matters, so slice it instead of materialising
+# a full-length rolling series just to read its final value.
+tail = prices.iloc[-rolling_year:]
+rolling_high, rolling_low = tail.max(), tail.min()
+
+# Binary-search the YTD base price instead of allocating a boolean mask
+# plus a sliced Series just to read one element.
+arr = prices.to_numpy()
+ytd_idx = prices.index.searchsorted(pd.Timestamp(today.year, 1, 1))
+ytd_return = (latest_price / arr[ytd_idx] - 1) * 100 if ytd_idx < len(arr) else np.nan
+period_return = (latest_price / arr[0] - 1) * 100
 
 col1, col2, col3 = st.columns(3)
 col1.metric("Latest Price", f"{latest_price:.2f}")
@@ -115,37 +140,52 @@ if not np.isnan(ytd_return):
 col5.metric("Period Return", f"{period_return:.2f}%")
 
 # ─── Rolling volatility chart ───────────────────────────────
+# Cached builders: widget reruns on unchanged data skip the figure
+# construction and its Plotly JSON serialisation.
+
+@st.cache_data(ttl=60 * 60)
+def build_vol_fig(vol: pd.Series, window: int):
+    import plotly.express as px
+    return px.line(
+        x=vol.index,
+        y=vol,
+        title=f"{window}-Day Rolling Volatility (Annualised %)",
+        labels={"x": "Date", "y": "Volatility (%)"},
+    )
+
+
+@st.cache_data(ttl=60 * 60)
+def build_heatmap_fig(returns: pd.DataFrame):
+    import plotly.express as px
+    return px.imshow(
+        returns,
+        color_continuous_scale="RdYlGn",
+        aspect="auto",
+        title="Monthly % Returns",
+    )
+
+
 vol_window = 30  # days
-rolling_vol = prices.pct_change().rolling(vol_window).std() * np.sqrt(252) * 100
-vol_fig = px.line(
-    x=rolling_vol.index,
-    y=rolling_vol,
-    title=f"{vol_window}-Day Rolling Volatility (Annualised %)",
-    labels={"x": "Date", "y": "Volatility (%)"},
-)
-st.plotly_chart(vol_fig, use_container_width=True)
+vol_series = rolling_vol(prices, vol_window)
+st.plotly_chart(build_vol_fig(vol_series, vol_window), use_container_width=True, config=STATIC)
 
 # ─── Monthly return heatmap ─────────────────────────────────
 with st.expander("Monthly Return Heatmap", expanded=False):
-    monthly_prices = prices.resample("M").last()
-    monthly_ret = monthly_prices.pct_change() * 100  # %
-    monthly_ret = monthly_ret.dropna()
+    # Month-end prices via one PeriodIndex groupby, then reshape with
+    # unstack – no intermediate heat_df or per-row month_name() strings.
+    monthly_prices = prices.groupby(prices.index.to_period("M")).last()
+    monthly_ret = monthly_prices.pct_change().mul(100).dropna()  # %
     if monthly_ret.empty:
         st.info("Not enough data to compute monthly returns.")
     else:
-        heat_df = monthly_ret.to_frame("Return")
-        heat_df["Year"] = heat_df.index.year
-        heat_df["Month"] = heat_df.index.month_name().str[:3]
-        pivot = heat_df.pivot(index="Year", columns="Month", values="Return").sort_index()
-        # Ensure month order
-        pivot = pivot[["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]]
-        fig_heat = px.imshow(
-            pivot,
-            color_continuous_scale="RdYlGn",
-            aspect="auto",
-            title="Monthly % Returns",
+        pivot = (
+            monthly_ret.groupby([monthly_ret.index.year, monthly_ret.index.month])
+            .first()
+            .unstack(level=1)
+            .sort_index()
         )
-        st.plotly_chart(fig_heat, use_container_width=True)
+        pivot.columns = _MONTH_ABBR[pivot.columns - 1]  # already month-ordered
+        st.plotly_chart(build_heatmap_fig(pivot), use_container_width=True, config=STATIC)
 
 # ─── Footer/caption ──────────────────────────────────────────
 st.caption(f"Data via Yahoo Finance · {start_date} → {end_date}")
@@ -1,6 +1,88 @@
 # File: pages/6_Chatbot.py
+import re
+
 import streamlit as st
 
+# ─── Keyword patterns & responses, keyed by regex group name ─────────
+# One alternation regex is compiled at import; each message then costs a
+# single C-level scan instead of a Python-level substring test per topic.
+# Dict order doubles as answer priority (highest first). Short tokens are
+# word-bounded so they don't fire inside ordinary words ('ma' in
+# 'market', 'summary', 'information').
+PATTERNS: dict[str, str] = {
+    "volat": "volat",
+    "drawdown": "drawdown",
+    "ret": "return",   # third, as in the original ladder ('year' checked on dispatch)
+    "ma": r"moving average|\bma\b",
+    "rsi": r"\brsi\b|relative strength index",
+    "macd": "macd",
+    "etf": r"\betf\b",
+    "compare": "compare|comparison",
+    "technical": "technical|indicator",
+    "metric": "metric|volatility|drawdown",
+}
+
+RESPONSES: dict[str, str] = {
+    "volat":
+        "Volatility refers to how much an asset's price fluctuates over time. "
+        "Higher volatility means larger price swings, indicating higher risk.",
+    "drawdown":
+        "Drawdown is the percentage drop from a peak to a subsequent low. "
+        "A max drawdown tells you the worst loss from a high point during a period.",
+    "ma":
+        "A moving average is the average price of an asset over a specific number of past days. "
+        "It's used to smooth out short-term fluctuations and highlight longer-term trends.",
+    "rsi":
+        "The Relative Strength Index (RSI) is a momentum indicator that ranges from 0 to 100. "
+        "Values above 70 suggest an asset might be overbought, while below 30 suggests it might be oversold.",
+    "macd":
+        "MACD (Moving Average Convergence Divergence) is a trend-following indicator. "
+        "It shows the difference between a short-term and a long-term exponential moving average and helps identify trend changes.",
+    "etf":
+        "An ETF (Exchange-Traded Fund) is a basket of securities that trades on an exchange like a stock. "
+        "ETFs often track an index (like SPY tracks the S&P 500) and allow easy diversification.",
+    "compare":
+        "To compare multiple assets, go to the **Comparison Dashboard** page. "
+        "There, you can enter multiple ticker symbols and see their performance side by side.",
+    "technical":
+        "The **Technical Analysis** page shows technical indicators for a chosen stock (moving averages, RSI, MACD). "
+        "Go to that page from the sidebar, enter a ticker, and you'll see those charts.",
+    "metric":
+        "On the **Key Statistics** page, you can find metrics like volatility, drawdown, and total return for the selected asset. "
+        "Just select a stock or ETF and the dashboard will calculate those for you.",
+}
+
+RETURN_RESPONSE = (
+    "Return typically means how much an investment has gained or lost, usually expressed as a percentage. "
+    "For example, a 10% annual return means the investment grew by 10% in one year."
+)
+
+DEFAULT_RESPONSE = (
+    "I'm not sure about that. I can help with definitions of finance terms "
+    "(e.g., volatility, RSI) or how to use the dashboard pages."
+)
+
+PAT = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in PATTERNS.items()),
+    re.IGNORECASE,
+)
+
+
+def get_response(query: str) -> str:
+    """Single regex scan; answer the highest-priority topic matched."""
+    found = {m.lastgroup for m in PAT.finditer(query)}
+    for name in PATTERNS:
+        if name not in found:
+            continue
+        if name == "ret":
+            # 'return' alone is too generic – only answer the compound case.
+            if "year" in query.lower():
+                return RETURN_RESPONSE
+            continue
+        return RESPONSES[name]
+    return DEFAULT_RESPONSE
+
+
 st.set_page_config(page_title="Chatbot Assistant", page_icon="💬")
 st.title("💬 Finance Chatbot Assistant")
 
@@ -10,58 +92,20 @@ st.write("Ask any basic finance question or ask for help with the dashboard. The
 if "messages" not in st.session_state:
     st.session_state.messages = []
 
-# Display existing chat messages
-for msg in st.session_state.messages:
-    with st.chat_message(msg["role"]):
-        st.markdown(msg["content"])
-
-# Chat input widget
+# Chat input widget – append the new turn to history *before* the render
+# loop, so every message goes through one code path and nothing is drawn
+# twice on the rerun that delivers the input.
 user_input = st.chat_input("Type your question here...")  # waits for user to submit
 if user_input:
-    # Append user's message to history and display it
     st.session_state.messages.append({"role": "user", "content": user_input})
-    with st.chat_message("user"):
-        st.markdown(user_input)
+    st.session_state.messages.append(
+        {"role": "assistant", "content": get_response(user_input)}
+    )
 
-    # Generate a response based on simple keyword matching
-    query = user_input.lower()
-    response = ""
-    if "volat" in query:
-        response = ("Volatility refers to how much an asset's price fluctuates over time. "
-                    "Higher volatility means larger price swings, indicating higher risk.")
-    elif "drawdown" in query:
-        response = ("Drawdown is the percentage drop from a peak to a subsequent low. "
-                    "A max drawdown tells you the worst loss from a high point during a period.")
-    elif "return" in query and "year" in query:
-        response = ("Return typically means how much an investment has gained or lost, usually expressed as a percentage. "
-                    "For example, a 10% annual return means the investment grew by 10% in one year.")
-    elif "moving average" in query or "ma" in query:
-        response = ("A moving average is the average price of an asset over a specific number of past days. "
-                    "It's used to smooth out short-term fluctuations and highlight longer-term trends.")
-    elif "rsi" in query or "relative strength index" in query:
-        response = ("The Relative Strength Index (RSI) is a momentum indicator that ranges from 0 to 100. "
-                    "Values above 70 suggest an asset might be overbought, while below 30 suggests it might be oversold.")
-    elif "macd" in query:
-        response = ("MACD (Moving Average Convergence Divergence) is a trend-following indicator. "
-                    "It shows the difference between a short-term and a long-term exponential moving average and helps identify trend changes.")
-    elif "etf" in query:
-        response = ("An ETF (Exchange-Traded Fund) is a basket of securities that trades on an exchange like a stock. "
-                    "ETFs often track an index (like SPY tracks the S&P 500) and allow easy diversification.")
-    elif "compare" in query or "comparison" in query:
-        response = ("To compare multiple assets, go to the **Comparison Dashboard** page. "
-                    "There, you can enter multiple ticker symbols and see their performance side by side.")
-    elif "technical" in query or "indicator" in query:
-        response = ("The **Technical Analysis** page shows technical indicators for a chosen stock (moving averages, RSI, MACD). "
-                    "Go to that page from the sidebar, enter a ticker, and you'll see those charts.")
-    elif "metric" in query or "volatility" in query or "drawdown" in query:
-        response = ("On the **Key Statistics** page, you can find metrics like volatility, drawdown, and total return for the selected asset. "
-                    "Just select a stock or ETF and the dashboard will calculate those for you.")
-    else:
-        response = ("I'm not sure about that. I can help with definitions of finance terms (e.g., volatility, RSI) or how to use the dashboard pages.")
-    # Append assistant response to history and display it
-    st.session_state.messages.append({"role": "assistant", "content": response})
-    with st.chat_message("assistant"):
-        st.markdown(response)
+# Display the chat history (including any message just appended)
+for msg in st.session_state.messages:
+    with st.chat_message(msg["role"]):
+        st.markdown(msg["content"])
 
 # Clear chat history button
 if st.sidebar.button("Clear Chat History"):
@@ -2,15 +2,29 @@
 Shared helpers – put in project root next to main.py
 """
 
+import functools
+import hashlib
+import math
 import os
 import sys
+import time
 from datetime import date
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import streamlit as st
-import yfinance as yf
 
+# yfinance is imported lazily inside the fetch helpers: it drags in
+# requests and friends (~300 ms cold), which pages served entirely from
+# cache never need to pay for.
+
+
+# --- optional numba acceleration (extra, like kaleido for PNG export) ---
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # --- make sure project root is import-able when pages run standalone ---
 root_dir = os.path.abspath(os.path.dirname(__file__))
@@ -18,19 +32,46 @@ if root_dir not in sys.path:
     sys.path.append(root_dir)
 
 
-@st.cache_data(ttl=60 * 60)   # cache one hour
+# --- on-disk price cache: survives restarts, skips Yahoo on warm starts ---
+_PRICE_CACHE_DIR = os.path.join(root_dir, ".cache", "prices")
+_PRICE_CACHE_TTL = 60 * 60 * 24   # one day – daily bars don't change faster
+
+
+def _price_cache_path(ticker: str, start: date, end: date) -> str:
+    key = hashlib.md5(f"{ticker}|{start}|{end}".encode()).hexdigest()
+    return os.path.join(_PRICE_CACHE_DIR, f"{key}.pkl")
+
+
+@functools.lru_cache(maxsize=256)
+def get_ticker(sym: str) -> "yf.Ticker":
+    """Memoised ``yf.Ticker`` – skips repeated session/cookie setup."""
+    import yfinance as yf
+    return yf.Ticker(sym)
+
+
+@st.cache_data(ttl=60 * 60)   # in-process tier; disk tier handled below
 def load_data(ticker: str, start: date, end: date) -> pd.DataFrame:
     """
     Robust download of historical OHLCV.
 
-    1. Try yf.download()
-    2. If empty, try yf.Ticker(...).history()
-    3. Flatten MultiIndex columns
-    4. Ensure an 'Adj Close' column exists (copy Close if missing)
+    1. Serve from the pickle side-cache when fresh (skips HTTP entirely)
+    2. Try yf.download()
+    3. If empty, try yf.Ticker(...).history()
+    4. Flatten MultiIndex columns
+    5. Record the preferred price column in ``df.attrs["price_col"]``
     """
     if not ticker:
         return pd.DataFrame()
 
+    cache_file = _price_cache_path(ticker, start, end)
+    try:
+        if os.path.exists(cache_file) and time.time() - os.path.getmtime(cache_file) < _PRICE_CACHE_TTL:
+            return pd.read_pickle(cache_file)
+    except Exception:
+        pass   # corrupt/unreadable cache entry – fall through to download
+
+    import yfinance as yf   # deferred: cache hits above never need it
+
     try:
         df = yf.download(ticker, start=start, end=end, auto_adjust=False, progress=False)
     except Exception as err:
@@ -40,7 +81,7 @@ def load_data(ticker: str, start: date, end: date) -> pd.DataFrame:
     # fallback if df empty (rare for some indices)
     if df.empty:
         try:
-            df = yf.Ticker(ticker).history(start=start, end=end, auto_adjust=False)
+            df = get_ticker(ticker).history(start=start, end=end, auto_adjust=False)
         except Exception as err:
             st.error(f"yfinance history() error for {ticker}: {err}")
             return pd.DataFrame()
@@ -55,8 +96,309 @@ def load_data(ticker: str, start: date, end: date) -> pd.DataFrame:
         else:
             df.columns = df.columns.droplevel(1)
 
-    # guarantee an Adj Close
-    if "Adj Close" not in df.columns and "Close" in df.columns:
-        df["Adj Close"] = df["Close"]
+    # Guarantee a DatetimeIndex here so pages don't each re-parse an
+    # index that yfinance already returns as datetime64.
+    if not isinstance(df.index, pd.DatetimeIndex):
+        df.index = pd.to_datetime(df.index)
+
+    # Point downstream code at the right price column instead of
+    # materialising a duplicate 'Adj Close' copy of 'Close'.
+    df.attrs["price_col"] = "Adj Close" if "Adj Close" in df.columns else "Close"
+
+    # Halve the cached footprint: float32 is plenty for display-grade
+    # prices, and the metric code upcasts to float64 where it matters.
+    num_cols = df.select_dtypes("float64").columns
+    if len(num_cols):
+        df[num_cols] = df[num_cols].astype("float32", copy=False)
+
+    try:
+        os.makedirs(_PRICE_CACHE_DIR, exist_ok=True)
+        df.to_pickle(cache_file)
+    except Exception:
+        pass   # cache write is best-effort
 
     return df
+
+
+@st.cache_data(ttl=60 * 60)
+def load_many(tickers: list, start: date, end: date) -> dict:
+    """
+    Download several tickers in a single yf.download round-trip.
+
+    Returns ``{ticker: OHLCV frame}``; symbols with no data map to empty
+    frames. One batched request amortises the TCP/TLS setup that
+    separate load_data calls would each pay.
+    """
+    tickers = [t for t in tickers if t]
+    if not tickers:
+        return {}
+    if len(tickers) == 1:
+        return {tickers[0]: load_data(tickers[0], start, end)}
+
+    import yfinance as yf
+
+    try:
+        raw = yf.download(tickers, start=start, end=end, group_by="ticker",
+                          auto_adjust=False, threads=True, progress=False)
+    except Exception as err:
+        st.error(f"yfinance error while downloading {', '.join(tickers)}: {err}")
+        return {t: pd.DataFrame() for t in tickers}
+
+    out = {}
+    for t in tickers:
+        try:
+            sub = raw[t].dropna(how="all")
+        except KeyError:
+            sub = pd.DataFrame()
+        if not sub.empty:
+            if not isinstance(sub.index, pd.DatetimeIndex):
+                sub.index = pd.to_datetime(sub.index)
+            sub.attrs["price_col"] = "Adj Close" if "Adj Close" in sub.columns else "Close"
+            num_cols = sub.select_dtypes("float64").columns
+            if len(num_cols):
+                sub[num_cols] = sub[num_cols].astype("float32", copy=False)
+        out[t] = sub
+    return out
+
+
+def downsample(series: pd.Series, max_points: int = 2000) -> pd.Series:
+    """
+    M4-style downsampling for plotting long series.
+
+    Buckets the series into ~max_points/4 groups and keeps the first,
+    last, min and max of each bucket, so peaks and troughs survive while
+    the point count stays near the number of pixels a chart can show.
+    Series at or below the threshold are returned unchanged.
+    """
+    n = len(series)
+    if n <= max_points:
+        return series
+
+    n_buckets = max(1, max_points // 4)
+    bucket = np.minimum(np.arange(n) * n_buckets // n, n_buckets - 1)
+
+    vals = pd.Series(series.to_numpy())
+    grouped = vals.groupby(bucket)
+    pos = pd.Series(np.arange(n)).groupby(bucket)
+
+    keep = np.unique(np.concatenate([
+        pos.first().to_numpy(),
+        pos.last().to_numpy(),
+        grouped.idxmin().to_numpy(),
+        grouped.idxmax().to_numpy(),
+    ]))
+    return series.iloc[keep]
+
+
+def _macd_kernel(p, a_fast, a_slow, a_sig):
+    # One recurrence loop over the price array: both EMAs, the MACD line
+    # and its signal EMA advance together instead of three ewm sweeps.
+    n = p.shape[0]
+    macd_line = np.empty(n)
+    signal = np.empty(n)
+    e_fast = e_slow = p[0]
+    macd_line[0] = signal[0] = 0.0
+    for i in range(1, n):
+        e_fast = a_fast * p[i] + (1.0 - a_fast) * e_fast
+        e_slow = a_slow * p[i] + (1.0 - a_slow) * e_slow
+        m = e_fast - e_slow
+        macd_line[i] = m
+        signal[i] = a_sig * m + (1.0 - a_sig) * signal[i - 1]
+    return macd_line, signal
+
+
+if njit is not None:
+    _macd_kernel = njit(cache=True)(_macd_kernel)
+
+
+def macd(prices: pd.Series, fast: int = 12, slow: int = 26, sig: int = 9):
+    """
+    MACD line and signal line for *prices* (histogram = line − signal).
+
+    Fuses the three EMA recurrences into one compiled pass when numba is
+    installed; otherwise falls back to the equivalent pandas ewm chain.
+    """
+    if njit is not None and len(prices) > 1:
+        line, signal = _macd_kernel(
+            prices.to_numpy(dtype=np.float64),
+            2.0 / (fast + 1), 2.0 / (slow + 1), 2.0 / (sig + 1),
+        )
+        return (
+            pd.Series(line, index=prices.index),
+            pd.Series(signal, index=prices.index),
+        )
+
+    ema_fast = prices.ewm(span=fast, adjust=False).mean()
+    ema_slow = prices.ewm(span=slow, adjust=False).mean()
+    line = ema_fast - ema_slow
+    return line, line.ewm(span=sig, adjust=False).mean()
+
+
+def _indicator_kernel(p, ma_short, ma_long, rsi_n, a_fast, a_slow, a_sig):
+    # One cache-resident sweep: running sums for both SMAs, Wilder
+    # gain/loss EMAs for RSI and the MACD recurrences advance together.
+    n = p.shape[0]
+    sma_s = np.full(n, np.nan)
+    sma_l = np.full(n, np.nan)
+    rsi = np.full(n, np.nan)
+    macd_line = np.empty(n)
+    signal = np.empty(n)
+
+    sum_s = sum_l = 0.0
+    alpha_rsi = 1.0 / rsi_n
+    avg_gain = avg_loss = 0.0
+    e_fast = e_slow = p[0]
+    macd_line[0] = signal[0] = 0.0
+
+    for i in range(n):
+        x = p[i]
+
+        sum_s += x
+        if i >= ma_short:
+            sum_s -= p[i - ma_short]
+        if i >= ma_short - 1:
+            sma_s[i] = sum_s / ma_short
+
+        sum_l += x
+        if i >= ma_long:
+            sum_l -= p[i - ma_long]
+        if i >= ma_long - 1:
+            sma_l[i] = sum_l / ma_long
+
+        if i == 0:
+            continue
+
+        d = x - p[i - 1]
+        gain = d if d > 0.0 else 0.0
+        loss = -d if d < 0.0 else 0.0
+        if i == 1:
+            avg_gain, avg_loss = gain, loss
+        else:
+            avg_gain = alpha_rsi * gain + (1.0 - alpha_rsi) * avg_gain
+            avg_loss = alpha_rsi * loss + (1.0 - alpha_rsi) * avg_loss
+        if avg_loss > 0.0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0.0:
+            rsi[i] = 100.0
+
+        e_fast = a_fast * x + (1.0 - a_fast) * e_fast
+        e_slow = a_slow * x + (1.0 - a_slow) * e_slow
+        m = e_fast - e_slow
+        macd_line[i] = m
+        signal[i] = a_sig * m + (1.0 - a_sig) * signal[i - 1]
+
+    return sma_s, sma_l, rsi, macd_line, signal
+
+
+if njit is not None:
+    _indicator_kernel = njit(cache=True, fastmath=True)(_indicator_kernel)
+
+
+def compute_indicators(prices: pd.Series, ma_short: int, ma_long: int,
+                       rsi_n: int = 14, macd_fast: int = 12,
+                       macd_slow: int = 26, macd_sig: int = 9) -> dict:
+    """
+    Moving averages, RSI and MACD for *prices* in a single fused pass.
+
+    Returns a dict of Series keyed ``sma_short``, ``sma_long``, ``rsi``,
+    ``macd``, ``signal`` and ``hist``. With numba installed the whole
+    computation is one compiled traversal of the price array; otherwise
+    it falls back to the equivalent pandas rolling/ewm calls.
+    """
+    idx = prices.index
+    if njit is not None and len(prices) > 1:
+        sma_s, sma_l, rsi, line, signal = _indicator_kernel(
+            prices.to_numpy(dtype=np.float64), ma_short, ma_long, rsi_n,
+            2.0 / (macd_fast + 1), 2.0 / (macd_slow + 1), 2.0 / (macd_sig + 1),
+        )
+        sma_s = pd.Series(sma_s, idx)
+        sma_l = pd.Series(sma_l, idx)
+        rsi = pd.Series(rsi, idx)
+        line = pd.Series(line, idx)
+        signal = pd.Series(signal, idx)
+    else:
+        sma_s = prices.rolling(ma_short).mean()
+        sma_l = prices.rolling(ma_long).mean()
+        delta = prices.diff().to_numpy()
+        avg_gain = pd.Series(np.maximum(delta, 0.0), idx).ewm(alpha=1 / rsi_n, adjust=False).mean()
+        avg_loss = pd.Series(np.maximum(-delta, 0.0), idx).ewm(alpha=1 / rsi_n, adjust=False).mean()
+        rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        line, signal = macd(prices, macd_fast, macd_slow, macd_sig)
+
+    return {
+        "sma_short": sma_s,
+        "sma_long": sma_l,
+        "rsi": rsi,
+        "macd": line,
+        "signal": signal,
+        "hist": line - signal,
+    }
+
+
+def _rolling_vol_kernel(returns, w, ann):
+    # Sliding sum/sum-of-squares update: add the new return, subtract the
+    # one leaving the window – O(n) instead of O(n·w).
+    n = returns.size
+    out = np.full(n, np.nan)
+    if n < w:
+        return out
+    s = s2 = 0.0
+    for i in range(w):
+        x = returns[i]
+        s += x
+        s2 += x * x
+    out[w - 1] = math.sqrt(max(s2 - s * s / w, 0.0) / (w - 1)) * ann
+    for i in range(w, n):
+        x_new = returns[i]
+        x_old = returns[i - w]
+        s += x_new - x_old
+        s2 += x_new * x_new - x_old * x_old
+        out[i] = math.sqrt(max(s2 - s * s / w, 0.0) / (w - 1)) * ann
+    return out
+
+
+if njit is not None:
+    _rolling_vol_kernel = njit(cache=True, fastmath=True)(_rolling_vol_kernel)
+
+
+def rolling_vol(prices: pd.Series, window: int = 30) -> pd.Series:
+    """
+    Annualised rolling volatility (%) of daily returns over *window* days.
+
+    Uses a numba-compiled sliding-moment kernel when available and a
+    rolling std over the same ndarray of returns otherwise. Returns are
+    computed via ``np.diff`` on the raw values – ``pct_change`` would
+    shift/realign a full Series copy just to produce the same numbers.
+    """
+    ann = math.sqrt(252) * 100
+    if len(prices) < 2:
+        return pd.Series(np.nan, index=prices.index)
+    p = prices.to_numpy(dtype=np.float64)
+    r = np.diff(p) / p[:-1]
+    out = np.empty(len(p))
+    out[0] = np.nan
+    if njit is not None:
+        out[1:] = _rolling_vol_kernel(r, window, ann)
+    else:
+        out[1:] = pd.Series(r).rolling(window).std().to_numpy() * ann
+    return pd.Series(out, index=prices.index)
+
+
+# --- cached yfinance metadata lookups (one network call per hour) ---
+
+@st.cache_data(ttl=60 * 60)
+def get_info(ticker: str) -> dict:
+    """Cached ``yf.Ticker(...).info`` dict (marketCap, sector, …)."""
+    return get_ticker(ticker).info or {}
+
+
+@st.cache_data(ttl=60 * 60)
+def get_earnings_dates(ticker: str) -> Optional[pd.DataFrame]:
+    """Cached upcoming/past earnings dates for *ticker*."""
+    return get_ticker(ticker).earnings_dates
+
+
+@st.cache_data(ttl=60 * 60)
+def get_dividends(ticker: str) -> pd.Series:
+    """Cached dividend history for *ticker*."""
+    return get_ticker(ticker).dividends